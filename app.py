@@ -1,110 +1,247 @@
+import copy
 import datetime
-from typing import Dict, List
+import inspect
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Union
 
-import altair as alt
+import pandas as pd
+import requests
 import streamlit as st
+from requests_futures.sessions import FuturesSession
+from urllib3.util.retry import Retry
 from yahooquery import Ticker
-import plotly.graph_objects as go
-
-BASE_MODULES = {
-    "asset_profile": "Asset Profile",
-    "calendar_events": "Calendar Events",
-    "esg_scores": "ESG Scores",
-    "financial_data": "Financial Data",
-    "fund_profile": "Fund Profile",
-    "key_stats": "Key Statistics",
-    "major_holders": "Major Holders",
-    "price": "Pricing",
-    "quote_type": "Quote Type",
-    "share_purchase_activity": "Share Purchase Activity",
-    "summary_detail": "Summary Detail",
-    "summary_profile": "Summary Profile",
-    "balance_sheet": "Balance Sheet",
-    "cash_flow": "Cash Flow",
-    "company_officers": "Company Officers",
-    "earning_history": "Earning History",
-    "earnings": "Earnings",
-    "earnings_trend": "Earnings Trend",
-    "index_trend": "Index Trend",
-    "sector_trend": "Sector Trend",
-    "industry_trend": "Industry Trend",
-    "fund_ownership": "Fund Ownership",
-    "grading_history": "Grading History",
-    "income_statement": "Income Statement",
-    "insider_holders": "Insider Holders",
-    "insider_transactions": "Insider Transactions",
-    "institution_ownership": "Institution Ownership",
-    "recommendation_trend": "Recommendation Trends",
-    "sec_filings": "SEC Filings",
-    "fund_bond_holdings": "Fund Bond Holdings",
-    "fund_bond_ratings": "Fund Bond Ratings",
-    "fund_equity_holdings": "Fund Equity Holdings",
-    "fund_holding_info": "Fund Holding Information",
-    "fund_performance": "Fund Performance",
-    "fund_sector_weightings": "Fund Sector Weightings",
-    "fund_top_holdings": "Fund Top Holdings",
-}
-
-PREMIUM = {
-    "p_balance_sheet": "Balance Sheet",
-    "p_cash_flow": "Cash Flow",
-    "p_income_statement": "Income Statement",
-    "p_company_360": "Company 360",
-    "p_portal": "Premium Portal",
-    "p_reports": "Research Reports",
-    "p_ideas": "Trade Ideas",
-    "p_technical_events": "Technical Events",
-    "p_value_analyzer": "Value Analyzer",
-    "p_value_analyzer_drilldown": "Value Analyzer Drilldown",
-}
-
-
-def format_func(option: str) -> str:
-    """Convert the BASE_MODULES key to a value
+from yahooquery.utils import HEADERS, TimeoutHTTPAdapter
+
+from modules import (
+    BASE_MODULES,
+    BASE_MODULES_SORTED,
+    INTERVALS,
+    MODULES_SORTED,
+    PERIODS,
+    PREMIUM,
+    PREMIUM_SORTED,
+    get_ticker_attr,
+    is_property,
+)
+
+# Connections kept alive by the shared session, and workers of its asynchronous executor
+_POOL_MAXSIZE = 50
+
+# history_view only reads the price history, so get_history can hand out the cached
+# frame instead of a copy. Set to False if a caller ever needs to mutate it.
+_READONLY = True
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _help_markdown(name: str) -> str:
+    """Render the signature and docstring of a Ticker attribute, in place of `st.help`
 
     Arguments:
-        option {str} -- The key identifying the module.
+        name {str} -- The name of the Ticker attribute
 
     Returns:
-        str -- The value. A nice module name
+        str -- Markdown describing the attribute
     """
-    return BASE_MODULES[option]
+    attr = get_ticker_attr(name)
+    signature = "" if is_property(name) else str(inspect.signature(attr))
+    return f"**`{name}{signature}`**\n\n```\n{inspect.getdoc(attr) or ''}\n```"
 
 
-def format_premium(option: str) -> str:
-    """Convert the PREMIUM key to a value
+def parse_symbols(symbols: str) -> Tuple[str, ...]:
+    """Parse the symbols entered by the user into a hashable cache key
 
     Arguments:
-        option {str} -- The key identifying the module.
+        symbols {str} -- A comma or space separated string of symbols
 
     Returns:
-        str -- The value. A nice module name
+        Tuple[str, ...] -- The sorted, lowercased symbols, so ordering and whitespace don't matter
     """
-    return PREMIUM[option]
+    return tuple(sorted({s.lower() for s in symbols.replace(",", " ").split()}))
 
 
-@st.cache
-def get_data(ticker: Ticker, attribute: str, *args) -> Dict:
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def get_data(symbols: Tuple[str, ...], attribute: str, *args, **kwargs) -> Dict:
     """Gets data from yahoo
 
     Arguments:
-        ticker {Ticker} -- an instance of Ticker
+        symbols {Tuple[str, ...]} -- A tuple of symbols, see `parse_symbols`
         attribute {str} -- The attribute of Ticker to call. Will return the results of a call to
             corresponding yahoo finance endpoint.
+        kwargs -- Keyword arguments used to initialize Ticker
 
     Returns:
         Dict -- A Dictionary of data from Yahoo
     """
-    try:
-        data = getattr(ticker, attribute)(*args)
-    except TypeError:
-        data = getattr(ticker, attribute)
+    ticker = init_ticker(",".join(symbols), **kwargs)
+    if is_property(attribute):
+        return getattr(ticker, attribute)
+    return getattr(ticker, attribute)(*args)
+
+
+@st.cache_resource(ttl=900, max_entries=64, show_spinner="Retrieving data...")
+def _history_raw(symbols: Tuple[str, ...], period, interval, start, end, **kwargs) -> Union[pd.DataFrame, Dict]:
+    """Gets historical pricing from yahoo, shared between reruns and sessions without copying"""
+    ticker = init_ticker(",".join(symbols), **kwargs)
+    return ticker.history(period=period, interval=interval, start=start, end=end)
+
+
+def get_history(symbols: Tuple[str, ...], period, interval, start, end, **kwargs) -> Union[pd.DataFrame, Dict]:
+    """Gets historical pricing from yahoo
+
+    The cached result is returned as is while `_READONLY` is set, so callers must not
+    mutate it.
+
+    Arguments:
+        symbols {Tuple[str, ...]} -- A tuple of symbols, see `parse_symbols`
+        period, interval, start, end -- Passed through to `Ticker.history`
+        kwargs -- Keyword arguments used to initialize Ticker
+
+    Returns:
+        Union[pd.DataFrame, Dict] -- The price history, or a Dictionary of errors from Yahoo
+    """
+    data = _history_raw(symbols, period, interval, start, end, **kwargs)
+    return data if _READONLY else data.copy()
+
+
+@st.cache_data(ttl=120, show_spinner="Retrieving data...")
+def get_option_chain(symbols: Tuple[str, ...], **kwargs) -> Union[pd.DataFrame, str]:
+    """Gets the option chain for every expiration date from yahoo
+
+    Arguments:
+        symbols {Tuple[str, ...]} -- A tuple of symbols, see `parse_symbols`
+        kwargs -- Keyword arguments used to initialize Ticker
+
+    Returns:
+        Union[pd.DataFrame, str] -- The option chain, or a message when no option chain data
+            was found
+    """
+    ticker = init_ticker(",".join(symbols), **kwargs)
+    return ticker.option_chain
+
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def get_all_modules(symbols: Tuple[str, ...], chunk_size: int = 20, max_workers: int = 4, **kwargs) -> Dict:
+    """Gets all modules from yahoo
+
+    yahooquery requests each symbol separately. An asynchronous Ticker already overlaps
+    those requests, so only synchronous requests are split into chunks fetched on a small
+    thread pool.
+
+    Arguments:
+        symbols {Tuple[str, ...]} -- A tuple of symbols, see `parse_symbols`
+        chunk_size {int} -- The number of symbols requested by each worker
+        max_workers {int} -- The number of chunks fetched at once
+        kwargs -- Keyword arguments used to initialize Ticker
+
+    Returns:
+        Dict -- A Dictionary of data from Yahoo, keyed by symbol
+    """
+    ticker = init_ticker(",".join(symbols), **kwargs)
+    if kwargs["asynchronous"] or len(symbols) <= chunk_size:
+        return ticker.all_modules
+
+    # Build the chunk tickers here so the workers don't touch Streamlit's caches
+    tickers = [
+        copy_ticker(ticker, list(symbols[i:i + chunk_size])) for i in range(0, len(symbols), chunk_size)
+    ]
+    data = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(lambda chunk_ticker: chunk_ticker.all_modules, tickers):
+            data.update(result)
     return data
 
 
-@st.cache(allow_output_mutation=True)
-def init_ticker(symbols, **kwargs):
-    return Ticker(symbols, **kwargs)
+def get_session(asynchronous: bool) -> requests.Session:
+    """Create a pooled session shared by every anonymous Ticker
+
+    The session is shared process wide, across users and symbols. Its adapter keeps up
+    to `_POOL_MAXSIZE` keep-alive connections. An asynchronous session also sends requests
+    from a single executor with the same number of workers, so every connection in the
+    pool can be in use at once. Concurrent users share those workers.
+
+    Arguments:
+        asynchronous {bool} -- Whether the session should make asynchronous requests
+
+    Returns:
+        requests.Session -- A session with keep-alive connection pooling and retries
+    """
+    if asynchronous:
+        session = FuturesSession(max_workers=_POOL_MAXSIZE)
+    else:
+        session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    session.mount(
+        "https://",
+        TimeoutHTTPAdapter(pool_connections=10, pool_maxsize=_POOL_MAXSIZE, max_retries=retries)
+    )
+    session.headers = random.choice(HEADERS)
+    return session
+
+
+@st.cache_resource
+def get_session_ticker(asynchronous: bool) -> Ticker:
+    """Set up the shared session once and return the Ticker that holds it
+
+    Creating a Ticker makes yahooquery request finance.yahoo.com for cookies and then fetch
+    a crumb tied to them. Doing that once per process keeps the crumbs of cached tickers
+    valid, which they wouldn't be if every new Ticker rewrote the shared cookie jar.
+
+    Arguments:
+        asynchronous {bool} -- Whether the session should make asynchronous requests
+
+    Returns:
+        Ticker -- A Ticker without symbols, holding the shared session and its crumb
+    """
+    return Ticker("", asynchronous=asynchronous, session=get_session(asynchronous))
+
+
+def copy_ticker(ticker: Ticker, symbols: Union[str, List[str]]) -> Ticker:
+    """Copy a Ticker for other symbols, sharing its session, cookies and crumb
+
+    This relies on yahooquery's attribute layout: a shallow copy shares the session and
+    crumb, and the symbols are the only per-request state, replaced here through the
+    public `symbols` setter.
+
+    Arguments:
+        ticker {Ticker} -- The Ticker to copy
+        symbols {Union[str, List[str]]} -- The symbols for the copy
+
+    Returns:
+        Ticker -- A new Ticker that makes no setup requests of its own
+    """
+    ticker = copy.copy(ticker)
+    ticker.symbols = symbols
+    return ticker
+
+
+@st.cache_resource
+def init_ticker(symbols: str, formatted: bool, asynchronous: bool, username: str, password: str) -> Ticker:
+    """Create a Ticker, shared across reruns and sessions with the same arguments
+
+    Arguments:
+        symbols {str} -- A comma separated string of symbols
+        formatted {bool} -- Whether to return formatted data from the API
+        asynchronous {bool} -- Whether to make asynchronous requests
+        username {str} -- Yahoo Finance username, for premium data
+        password {str} -- Yahoo Finance password, for premium data
+
+    Returns:
+        Ticker -- A yahooquery Ticker object
+    """
+    # Logging in stores the user's cookies on the session, so only share it
+    # between anonymous tickers
+    if username:
+        return Ticker(
+            symbols,
+            formatted=formatted,
+            asynchronous=asynchronous,
+            username=username,
+            password=password
+        )
+    ticker = copy_ticker(get_session_ticker(asynchronous), symbols)
+    ticker.formatted = formatted
+    return ticker
 
 
 def main():
@@ -114,8 +251,9 @@ def main():
         "Enter symbol or list of symbols (comma, space separated)", value="aapl"
     )
 
+    symbols_tuple = parse_symbols(symbols)
     asynchronous = st.sidebar.radio(
-        "Make Asynchronous requests?", options=[False, True]
+        "Make Asynchronous requests?", options=[False, True], index=int(len(symbols_tuple) > 1)
     )
     asynchronous_str = "" if not asynchronous else ", asynchronous=True"
 
@@ -134,20 +272,19 @@ def main():
         type="password"
     )
 
-    tickers = init_ticker(
-        symbols,
-        formatted=formatted,
-        asynchronous=asynchronous,
-        username=username,
-        password=password)
+    ticker_kwargs = {
+        'formatted': formatted,
+        'asynchronous': asynchronous,
+        'username': username,
+        'password': password
+    }
 
     page = st.sidebar.selectbox(
         "Choose a page", ["Homepage", "Modules", "Options", "Historical Pricing", "Premium"]
     )
 
     strings = {
-        'formatted_str': formatted_str,
-        'asynchronous_str': asynchronous_str,
+        'ticker_prefix': f"Ticker('{symbols}'{formatted_str}{asynchronous_str})",
         'username': username,
         'password': password
     }
@@ -155,23 +292,23 @@ def main():
     st.markdown("# Welcome to [YahooQuery](https://github.com/dpguthrie/yahooquery)")
 
     if page == "Homepage":
-        homepage_view(tickers, symbols, strings)
+        tickers = init_ticker(",".join(symbols_tuple), **ticker_kwargs)
+        homepage_view(tickers, strings)
     elif page == "Premium":
-        premium_view(tickers, symbols, strings)
+        premium_view(symbols_tuple, strings, ticker_kwargs)
     elif page == "Modules":
-        base_view(tickers, symbols, strings)
+        base_view(symbols_tuple, strings, ticker_kwargs)
     elif page == "Options":
-        options_view(tickers, symbols, strings)
+        options_view(symbols_tuple, strings, ticker_kwargs)
     else:
-        history_view(tickers, symbols, strings)
+        history_view(symbols_tuple, strings, ticker_kwargs)
 
 
-def homepage_view(tickers: Ticker, symbols: List[str], strings: dict):
+def homepage_view(tickers: Ticker, strings: dict):
     """Provides the view of the Home Page
 
     Arguments:
         tickers {Ticker} -- A yahaooquery Ticker object
-        symbols {List[str]} -- A list of symbols
         strings {dict} -- Dictionary containing strings used in Ticker init
     """
 
@@ -198,22 +335,23 @@ def homepage_view(tickers: Ticker, symbols: List[str], strings: dict):
         ```python
         from yahooquery import Ticker
 
-        tickers = Ticker('{symbols}'{strings['formatted_str']}{strings['asynchronous_str']})
+        tickers = {strings['ticker_prefix']}
         ```
     """
     )
     st.help(tickers)
 
 
-def premium_view(tickers: Ticker, symbols: List[str], strings: dict):
+@st.fragment
+def premium_view(symbols: Tuple[str, ...], strings: dict, ticker_kwargs: dict):
     """A view of the basic functionality of Ticker.
 
     The user can select a module and the help text, code and result will be presented.
 
     Arguments:
-        tickers {Ticker} -- A yahaooquery Ticker object
-        symbols {List[str]} -- A list of symbols
+        symbols {Tuple[str, ...]} -- A tuple of symbols, see `parse_symbols`
         strings {dict} -- Dictionary containing strings used in Ticker init
+        ticker_kwargs {dict} -- Keyword arguments used to initialize Ticker
     """
 
     st.header("Premium Data")
@@ -222,48 +360,47 @@ def premium_view(tickers: Ticker, symbols: List[str], strings: dict):
         Select an option below to see the premium data available"""
     )
     module = st.selectbox(
-        "Select Data", options=sorted(list(PREMIUM.keys())), format_func=format_premium
+        "Select Data", options=PREMIUM_SORTED, format_func=PREMIUM.__getitem__
     )
-    st.help(getattr(Ticker, module))
-    is_property = isinstance(getattr(Ticker, module), property)
-    if is_property:
-        st.code(f"Ticker('{symbols}'{strings['formatted_str']}{strings['asynchronous_str']}).{module}", language="python")
-        data = get_data(tickers, module)
+    st.markdown(_help_markdown(module))
+    if is_property(module):
+        st.code(f"{strings['ticker_prefix']}.{module}", language="python")
+        data = get_data(symbols, module, **ticker_kwargs)
     else:
         frequency = st.selectbox("Select Frequency", options=["Annual", "Quarterly"])
         arg = frequency[:1].lower()
-        st.code(f"Ticker('{symbols}'{strings['formatted_str']}{strings['asynchronous_str']}).{module}(frequency='{arg}')")
-        data = get_data(tickers, module, arg)
+        st.code(f"{strings['ticker_prefix']}.{module}(frequency='{arg}')")
+        data = get_data(symbols, module, arg, **ticker_kwargs)
     st.write(data)
 
 
-def base_view(tickers: Ticker, symbols: List[str], strings: dict):
+@st.fragment
+def base_view(symbols: Tuple[str, ...], strings: dict, ticker_kwargs: dict):
     """A view of the basic functionality of Ticker.
 
     The user can select a module and the help text, code and result will be presented.
 
     Arguments:
-        tickers {Ticker} -- A yahaooquery Ticker object
-        symbols {List[str]} -- A list of symbols
+        symbols {Tuple[str, ...]} -- A tuple of symbols, see `parse_symbols`
         strings {dict} -- Dictionary containing strings used in Ticker init
+        ticker_kwargs {dict} -- Keyword arguments used to initialize Ticker
     """
 
     st.header("Modules")
     method = st.selectbox("Select Method", options=["Single Module", "Multiple Modules", "All Modules"])
     if method == "Single Module":
         module = st.selectbox(
-            "Select Module", options=sorted(list(BASE_MODULES.keys())), format_func=format_func
+            "Select Module", options=BASE_MODULES_SORTED, format_func=BASE_MODULES.__getitem__
         )
-        st.help(getattr(Ticker, module))
-        is_property = isinstance(getattr(Ticker, module), property)
-        if is_property:
-            st.code(f"Ticker('{symbols}'{strings['formatted_str']}{strings['asynchronous_str']}).{module}", language="python")
-            data = get_data(tickers, module)
+        st.markdown(_help_markdown(module))
+        if is_property(module):
+            st.code(f"{strings['ticker_prefix']}.{module}", language="python")
+            data = get_data(symbols, module, **ticker_kwargs)
         else:
             frequency = st.selectbox("Select Frequency", options=["Annual", "Quarterly"])
             arg = frequency[:1].lower()
-            st.code(f"Ticker('{symbols}'{strings['formatted_str']}{strings['asynchronous_str']}).{module}(frequency='{arg}')")
-            data = get_data(tickers, module, arg)
+            st.code(f"{strings['ticker_prefix']}.{module}(frequency='{arg}')")
+            data = get_data(symbols, module, arg, **ticker_kwargs)
         st.write(data)
     else:
         st.markdown(
@@ -276,24 +413,24 @@ def base_view(tickers: Ticker, symbols: List[str], strings: dict):
             - the `all_modules` property retrieves all Base modules"""
         )
         if method == "All Modules":
-            st.help(getattr(Ticker, "all_modules"))
-            st.code(f"Ticker('{symbols}'{strings['formatted_str']}{strings['asynchronous_str']}).all_modules", language="python")
-            data = get_data(tickers, "all_modules")
+            st.markdown(_help_markdown("all_modules"))
+            st.code(f"{strings['ticker_prefix']}.all_modules", language="python")
+            data = get_all_modules(symbols, **ticker_kwargs)
             st.json(data)
         else:
 
             default_modules = ["assetProfile"]
             modules = st.multiselect(
                 "Select modules",
-                options=sorted(Ticker.MODULES),  # pylint: disable=protected-access
+                options=MODULES_SORTED,
                 default=default_modules,
             )
-            st.help(getattr(Ticker, "get_modules"))
-            st.code(f"Ticker('{symbols}'{strings['formatted_str']}).get_modules({modules})", language="python")
+            st.markdown(_help_markdown("get_modules"))
+            st.code(f"{strings['ticker_prefix']}.get_modules({modules})", language="python")
             if not modules:
                 st.warning("You must select at least one module")
             else:
-                data = get_data(tickers, "get_modules")(modules)
+                data = get_data(symbols, "get_modules", modules, **ticker_kwargs)
                 st.json(data)
     
 
@@ -301,12 +438,14 @@ def base_view(tickers: Ticker, symbols: List[str], strings: dict):
 # Reset index to get column headers
 # Buttons under Table to download data
 # Some kind of chart that helps me understand the data/ get insights.
-def options_view(tickers: Ticker, symbols: List[str], strings: dict):
+@st.fragment
+def options_view(symbols: Tuple[str, ...], strings: dict, ticker_kwargs: dict):
     """Provides an illustration of the `option_chain` method
 
     Arguments:
-        tickers {Ticker} -- A yahaooquery Ticker object
-        symbols {List[str]} -- A list of symbols
+        symbols {Tuple[str, ...]} -- A tuple of symbols, see `parse_symbols`
+        strings {dict} -- Dictionary containing strings used in Ticker init
+        ticker_kwargs {dict} -- Keyword arguments used to initialize Ticker
     """
     st.header("Option Chain")
     st.write(
@@ -316,17 +455,21 @@ def options_view(tickers: Ticker, symbols: List[str], strings: dict):
             dates for a given symbol(s)
     """
     )
-    st.code(f"Ticker('{symbols}'{strings['formatted_str']}{strings['asynchronous_str']}).option_chain", language="python")
-    data = get_data(tickers, "option_chain")
+    st.code(f"{strings['ticker_prefix']}.option_chain", language="python")
+    if st.button("Refresh"):
+        get_option_chain.clear(symbols, **ticker_kwargs)
+    data = get_option_chain(symbols, **ticker_kwargs)
     st.write(data)
 
 
-def history_view(tickers: Ticker, symbols: List[str], strings: dict):
+@st.fragment
+def history_view(symbols: Tuple[str, ...], strings: dict, ticker_kwargs: dict):
     """Provides an illustration of the `Ticker.history` method
 
     Arguments:
-        tickers {Ticker} -- A yahaooquery Ticker object
-        symbols {List[str]} -- A list of symbols
+        symbols {Tuple[str, ...]} -- A tuple of symbols, see `parse_symbols`
+        strings {dict} -- Dictionary containing strings used in Ticker init
+        ticker_kwargs {dict} -- Keyword arguments used to initialize Ticker
     """
     st.header("Historical Pricing")
     st.write(
@@ -334,7 +477,7 @@ def history_view(tickers: Ticker, symbols: List[str], strings: dict):
         Retrieve historical pricing data for a given symbol(s)
     """
     )
-    st.help(getattr(Ticker, "history"))
+    st.markdown(_help_markdown("history"))
     st.markdown(
         """
         1. Select a period **or** enter start and end dates.
@@ -345,53 +488,61 @@ def history_view(tickers: Ticker, symbols: List[str], strings: dict):
     history_args = {
         "period": "1y",
         "interval": "1d",
-        "start": datetime.datetime.now() - datetime.timedelta(days=365),
+        "start": None,
         "end": None,
     }
     option_1 = st.selectbox("Select Period or Start / End Dates", ["Period", "Dates"], 0)
     if option_1 == "Period":
         history_args["period"] = st.selectbox(
-            "Select Period", options=Ticker.PERIODS, index=5  # pylint: disable=protected-access
+            "Select Period", options=PERIODS, index=5
         )
-
-        history_args["start"] = None
-        history_args["end"] = None
     else:
-        history_args["start"] = st.date_input("Select Start Date", value=history_args["start"])
+        default_start = datetime.date.today() - datetime.timedelta(days=365)
+        history_args["start"] = st.date_input("Select Start Date", value=default_start)
         history_args["end"] = st.date_input("Select End Date")
         history_args["period"] = None
 
     st.markdown("**THEN**")
     history_args["interval"] = st.selectbox(
-        "Select Interval", options=Ticker.INTERVALS, index=8  # pylint: disable=protected-access
+        "Select Interval", options=INTERVALS, index=8
     )
     args_string = [str(k) + "='" + str(v) + "'" for k, v in history_args.items() if v is not None]
-    st.code(f"Ticker('{symbols}'{strings['formatted_str']}{strings['asynchronous_str']}).history({', '.join(args_string)})", language="python")
-    dataframe = tickers.history(**history_args)
+    st.code(f"{strings['ticker_prefix']}.history({', '.join(args_string)})", language="python")
+    dataframe = get_history(symbols, **history_args, **ticker_kwargs)
 
     if isinstance(dataframe, dict):
         st.write(dataframe)
     else:
-        if len(tickers.symbols) > 1:
-            chart = (
-                alt.Chart(dataframe.reset_index())
-                .mark_line()
-                .encode(alt.Y("adjclose:Q", scale=alt.Scale(zero=False)), x="date", color="symbol").properties(
-                    width=660,
-                    height=400
+        # Charting libraries are only imported once this page is visited. There's nothing
+        # to chart when none of the symbols returned data
+        if not dataframe.empty:
+            if len(symbols) > 1:
+                import altair as alt
+
+                # Intraday intervals don't include adjusted prices
+                price = "adjclose" if "adjclose" in dataframe.columns else "close"
+                chart = (
+                    alt.Chart(dataframe[[price]].reset_index())
+                    .mark_line()
+                    .encode(alt.Y(f"{price}:Q", scale=alt.Scale(zero=False)), x="date", color="symbol").properties(
+                        width=660,
+                        height=400
+                    )
                 )
-            )
-            st.write("", "", chart)
-        else:
-            fig = go.Figure(data=go.Ohlc(
-                x=dataframe.index,
-                open=dataframe['open'],
-                high=dataframe['high'],
-                low=dataframe['low'],
-                close=dataframe['close']
-            ))
-            st.plotly_chart(fig)
-            
+                st.write("", "", chart)
+            else:
+                import plotly.graph_objects as go
+
+                index = dataframe.index
+                fig = go.Figure(data=go.Ohlc(
+                    x=index.get_level_values("date") if isinstance(index, pd.MultiIndex) else index,
+                    open=dataframe['open'].to_numpy(),
+                    high=dataframe['high'].to_numpy(),
+                    low=dataframe['low'].to_numpy(),
+                    close=dataframe['close'].to_numpy()
+                ))
+                st.plotly_chart(fig)
+
         st.dataframe(dataframe)
 
 
@@ -0,0 +1,78 @@
+"""Yahoo Finance modules available through Ticker, mapped to display names"""
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+from yahooquery import Ticker
+
+BASE_MODULES: Mapping[str, str] = MappingProxyType({
+    "asset_profile": "Asset Profile",
+    "calendar_events": "Calendar Events",
+    "esg_scores": "ESG Scores",
+    "financial_data": "Financial Data",
+    "fund_profile": "Fund Profile",
+    "key_stats": "Key Statistics",
+    "major_holders": "Major Holders",
+    "price": "Pricing",
+    "quote_type": "Quote Type",
+    "share_purchase_activity": "Share Purchase Activity",
+    "summary_detail": "Summary Detail",
+    "summary_profile": "Summary Profile",
+    "balance_sheet": "Balance Sheet",
+    "cash_flow": "Cash Flow",
+    "company_officers": "Company Officers",
+    "earning_history": "Earning History",
+    "earnings": "Earnings",
+    "earnings_trend": "Earnings Trend",
+    "index_trend": "Index Trend",
+    "sector_trend": "Sector Trend",
+    "industry_trend": "Industry Trend",
+    "fund_ownership": "Fund Ownership",
+    "grading_history": "Grading History",
+    "income_statement": "Income Statement",
+    "insider_holders": "Insider Holders",
+    "insider_transactions": "Insider Transactions",
+    "institution_ownership": "Institution Ownership",
+    "recommendation_trend": "Recommendation Trends",
+    "sec_filings": "SEC Filings",
+    "fund_bond_holdings": "Fund Bond Holdings",
+    "fund_bond_ratings": "Fund Bond Ratings",
+    "fund_equity_holdings": "Fund Equity Holdings",
+    "fund_holding_info": "Fund Holding Information",
+    "fund_performance": "Fund Performance",
+    "fund_sector_weightings": "Fund Sector Weightings",
+    "fund_top_holdings": "Fund Top Holdings",
+})
+
+PREMIUM: Mapping[str, str] = MappingProxyType({
+    "p_balance_sheet": "Balance Sheet",
+    "p_cash_flow": "Cash Flow",
+    "p_income_statement": "Income Statement",
+    "p_company_360": "Company 360",
+    "p_portal": "Premium Portal",
+    "p_reports": "Research Reports",
+    "p_ideas": "Trade Ideas",
+    "p_technical_events": "Technical Events",
+    "p_value_analyzer": "Value Analyzer",
+    "p_value_analyzer_drilldown": "Value Analyzer Drilldown",
+})
+
+# Streamlit re-executes app.py in a fresh module on every rerun, while this module
+# stays cached in sys.modules, so the selectbox options are only built once per process
+BASE_MODULES_SORTED = tuple(sorted(BASE_MODULES))
+PREMIUM_SORTED = tuple(sorted(PREMIUM))
+MODULES_SORTED = tuple(sorted(Ticker.MODULES))
+PERIODS = tuple(Ticker.PERIODS)
+INTERVALS = tuple(Ticker.INTERVALS)
+
+
+@lru_cache(maxsize=None)
+def get_ticker_attr(name: str):
+    """Look up an attribute on the Ticker class, memoized for the life of the process"""
+    return getattr(Ticker, name)
+
+
+@lru_cache(maxsize=None)
+def is_property(name: str) -> bool:
+    """Whether the Ticker attribute is a property rather than a method"""
+    return isinstance(get_ticker_attr(name), property)